@@ -1,7 +1,8 @@
 __version__ = "0.2.0"
 __authors__ = ["ReiDoBrega", "duck", "xhlove", "Ooo0xffooO"]
 
-from .cdm import CDM
+from typing import TYPE_CHECKING
+
 from .exceptions import (
     MonalisaError,
     MonalisaLicenseError,
@@ -10,6 +11,9 @@ from .exceptions import (
 from .license import License
 from .types import Key, KeyType
 
+if TYPE_CHECKING:
+    from .cdm import CDM
+
 __all__ = [
     "CDM",
     "License",
@@ -19,3 +23,17 @@ __all__ = [
     "MonalisaLicenseError",
     "MonalisaSessionError",
 ]
+
+
+def __getattr__(name: str):
+    """Import CDM (and its crypto dependencies) on first access"""
+    if name == "CDM":
+        from .cdm import CDM
+
+        globals()["CDM"] = CDM
+        return CDM
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
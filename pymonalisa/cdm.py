@@ -3,7 +3,7 @@ import uuid
 from pymonalisa.exceptions import MonalisaLicenseError, MonalisaSessionError
 from pymonalisa.license import License
 from pymonalisa.types import Key, KeyType
-from pymonalisa.utils import decrypt_ticket_key, extract_dcid
+from pymonalisa.utils import _decrypt_ticket_key_raw, _extract_dcid_raw
 
 
 class CDM:
@@ -35,7 +35,21 @@ class CDM:
             self._sessions[session_id].cleanup()
             del self._sessions[session_id]
 
-    def get_license_challenge(self, session_id: str, ticket: str):
+    def get_license_challenge(
+        self, session_id: str, ticket: License | str | bytes
+    ) -> License:
+        """
+        Wrap ticket data in a License
+
+        Args:
+            session_id: Session ID (unused)
+            ticket: Ticket data (License, base64 string or raw bytes)
+
+        Returns:
+            License: License instance
+        """
+        if isinstance(ticket, License):
+            return ticket
         return License(ticket)
 
     def parse_license(self, session_id: str, license: License | str | bytes):
@@ -75,8 +89,12 @@ class CDM:
             raise MonalisaSessionError(f"Session not found: {session_id}")
         return self._sessions[session_id]
 
-    def __del__(self):
-        """Cleanup all sessions on destruction"""
+    def __enter__(self) -> "CDM":
+        """Enter the CDM context"""
+        return self
+
+    def __exit__(self, _exc_type, _exc_value, _traceback):
+        """Close all open sessions"""
         for session_id in list(self._sessions.keys()):
             self.close(session_id)
 
@@ -84,6 +102,8 @@ class CDM:
 class Session:
     """MonaLisa CDM session"""
 
+    __slots__ = ("session_id", "_keys")
+
     def __init__(self, session_id: str):
         """Initialize session"""
         self.session_id = session_id
@@ -92,14 +112,14 @@ class Session:
     def parse_license(self, license_: License):
         """Parse license and extract keys directly"""
         try:
-            license_str = license_.b64
+            raw = license_.raw
 
             # Decrypt license key using Python logic
-            _, _, ckey32 = decrypt_ticket_key(license_str)
+            _, _, ckey32 = _decrypt_ticket_key_raw(raw)
             key_bytes = ckey32[:16]
 
             # Extract CID from license for KID generation
-            dcid = extract_dcid(license_str)
+            dcid = _extract_dcid_raw(raw)
             if dcid:
                 kid = uuid.uuid5(uuid.NAMESPACE_DNS, dcid)
             else:
@@ -113,9 +133,9 @@ class Session:
         except Exception as e:
             raise MonalisaLicenseError(f"Failed to parse license: {e}")
 
-    def get_keys(self, key_type: KeyType | None = None) -> list[Key]:
+    def get_keys(self, key_type: KeyType | None = KeyType.CONTENT) -> list[Key]:
         """Get keys from session"""
-        if key_type:
+        if key_type is not None:
             return [key for key in self._keys if key.type == key_type]
         return self._keys.copy()
 
@@ -1,4 +1,4 @@
-import base64
+import binascii
 
 
 class License:
@@ -11,17 +11,16 @@ class License:
         Args:
             data: License data (base64 string or raw bytes)
         """
+        self._data_b64: str | None = None
         if isinstance(data, str):
             try:
-                self.data = base64.b64decode(data)
-                self.data_b64 = data
+                self.data = binascii.a2b_base64(data)
+                self._data_b64 = data
             except Exception:
                 # If not base64, treat as raw string
                 self.data = data.encode("utf-8")
-                self.data_b64 = base64.b64encode(self.data).decode("utf-8")
         else:
             self.data = data
-            self.data_b64 = base64.b64encode(data).decode("utf-8")
 
     @classmethod
     def from_ticket(cls, ticket_data: str | bytes) -> "License":
@@ -36,6 +35,17 @@ class License:
         """
         return cls(ticket_data)
 
+    @property
+    def data_b64(self) -> str:
+        """Base64 encoded license data, encoded on first access for raw input"""
+        if self._data_b64 is None:
+            self._data_b64 = binascii.b2a_base64(self.data, newline=False).decode("utf-8")
+        return self._data_b64
+
+    @data_b64.setter
+    def data_b64(self, value: str):
+        self._data_b64 = value
+
     @property
     def raw(self) -> bytes:
         """Get raw license data"""
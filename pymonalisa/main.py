@@ -1,4 +1,5 @@
 import logging
+import traceback
 from datetime import datetime
 
 import click
@@ -114,39 +115,39 @@ def license_(
 
     try:
         log.info("Initializing CDM...")
-        cdm = CDM()
-        log.info("CDM initialized successfully")
+        with CDM() as cdm:
+            log.info("CDM initialized successfully")
 
-        log.info("Opening CDM session...")
-        session_id = cdm.open()
-        log.info(f"Session opened: {session_id}")
+            log.info("Opening CDM session...")
+            session_id = cdm.open()
+            log.info(f"Session opened: {session_id}")
 
-        log.info("Processing license data...")
-        license_obj = License(license_data)
+            log.info("Processing license data...")
+            license_obj = License(license_data)
 
-        log.info("Parsing license and extracting keys...")
-        cdm.parse_license(session_id, license_obj)
-        log.info("License parsed successfully")
+            log.info("Parsing license and extracting keys...")
+            cdm.parse_license(session_id, license_obj)
+            log.info("License parsed successfully")
 
-        keys = cdm.get_keys(session_id, KeyType.CONTENT)  # CONTENT only for now
+            keys = cdm.get_keys(session_id, KeyType.CONTENT)  # CONTENT only for now
 
-        if not keys:
-            log.warning("No keys found in license")
-            cdm.close(session_id)
-            return
+            if not keys:
+                log.warning("No keys found in license")
+                cdm.close(session_id)
+                return
 
-        log.info(f"Found {len(keys)} keys:")
-        for (
-            key
-        ) in keys:  # One only always, dont sure about others versions up LicenseVersion 3
-            # NOTE: we can handle here but the key_type always will be CONTENT, to decrypt the IQIYI bbts we need the KEY only, not the KID
-            if key_type == "CONTENT":
-                log.info(f"{key.key.hex()}")
-            else:
-                log.info(f"{key.kid.hex()}:{key.key.hex()}")
+            log.info(f"Found {len(keys)} keys:")
+            for key in (
+                keys
+            ):  # One only always, dont sure about others versions up LicenseVersion 3
+                # NOTE: we can handle here but the key_type always will be CONTENT, to decrypt the IQIYI bbts we need the KEY only, not the KID
+                if key_type == "CONTENT":
+                    log.info(f"{key.key.hex()}")
+                else:
+                    log.info(f"{key.kid.hex()}:{key.key.hex()}")
 
-        cdm.close(session_id)
-        log.info("Session closed successfully")
+            cdm.close(session_id)
+            log.info("Session closed successfully")
 
     except MonalisaLicenseError as e:
         log.error(f"License error: {e}")
@@ -157,8 +158,6 @@ def license_(
     except Exception as e:
         log.error(f"Unexpected error: {e}")
         if log.isEnabledFor(logging.DEBUG):
-            import traceback
-
             log.debug(traceback.format_exc())
 
 
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
 from enum import Enum
 
@@ -11,7 +13,7 @@ class KeyType(Enum):
     OPERATOR_SESSION = "OPERATOR_SESSION"
 
 
-@dataclass
+@dataclass(slots=True)
 class Key:
     """Represents a MonaLisa key"""
 
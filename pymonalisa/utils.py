@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import base64
+import binascii
 import hashlib
 import re
+import struct
 from dataclasses import dataclass
 
 from Cryptodome.Cipher import AES
@@ -11,6 +12,13 @@ from Cryptodome.Util.Padding import unpad
 V3_UNWRAP_MASK_32 = bytes.fromhex(
     "65ab3479a2d83c6f60b891c024194e24a0d2a25c1f7a4926a3d4ac0c675255d8"
 )
+_V3_UNWRAP_MASK_INT = int.from_bytes(V3_UNWRAP_MASK_32, "big")
+
+_DCID_RE = re.compile(rb"DCID-[A-Z0-9-]+")
+_NON_ASCII = bytes(range(128, 256))
+
+_UNIT_HEADER = struct.Struct(">BBH")
+_CHUNK_HEADER = struct.Struct(">BH")
 
 
 @dataclass
@@ -22,23 +30,23 @@ class TicketData:
 
 
 def read_unit(buf: bytes, pos: int) -> tuple[int, int, bytes, int]:
-    if pos + 4 > len(buf):
+    buf_len = len(buf)
+    if pos + 4 > buf_len:
         raise ValueError("truncated outer TLV header")
-    typ = buf[pos]
-    data_len = (buf[pos + 2] << 8) | buf[pos + 3]
+    typ, idx, data_len = _UNIT_HEADER.unpack_from(buf, pos)
     end = pos + 4 + data_len
-    if end > len(buf):
+    if end > buf_len:
         raise ValueError("truncated outer TLV payload")
-    return typ, buf[pos + 1], buf[pos + 4 : end], end
+    return typ, idx, buf[pos + 4 : end], end
 
 
 def iter_type3_chunks(data: bytes):
+    data_len = len(data)
     pos = 0
-    while pos + 4 <= len(data):
-        flag = data[pos]
-        seg_len = (data[pos + 1] << 8) | data[pos + 2]
+    while pos + 4 <= data_len:
+        flag, seg_len = _CHUNK_HEADER.unpack_from(data, pos)
         mark_pos = pos + 3 + seg_len
-        if mark_pos >= len(data):
+        if mark_pos >= data_len:
             break
         seg = data[pos + 3 : pos + 3 + seg_len]
         kind = data[mark_pos]
@@ -46,16 +54,19 @@ def iter_type3_chunks(data: bytes):
         pos += 4 + seg_len
 
 
-def parse_ticket(license_b64: str) -> TicketData:
-    raw = base64.b64decode(license_b64)
+def parse_ticket(license_b64: str | bytes) -> TicketData:
+    return _parse_ticket_raw(binascii.a2b_base64(license_b64))
 
+
+def _parse_ticket_raw(raw: bytes) -> TicketData:
     version = None
     uid = b""
     kek_data = b""
     ckey_cipher_data = b""
 
+    raw_len = len(raw)
     pos = 0
-    while pos + 4 <= len(raw):
+    while pos + 4 <= raw_len:
         typ, _idx, data, pos_next = read_unit(raw, pos)
 
         if typ == 0:
@@ -74,7 +85,7 @@ def parse_ticket(license_b64: str) -> TicketData:
             cert_len = data[1]
             hash_len = (data[cert_len + 2] << 8) | data[cert_len + 3]
             hash_in_ticket = data[cert_len + 4 : cert_len + 4 + hash_len]
-            calc = hashlib.sha256(raw[:pos]).digest()
+            calc = hashlib.sha256(memoryview(raw)[:pos]).digest()
             if data[0] == 1 and calc != hash_in_ticket:
                 raise ValueError("ticket sha256 verification failed")
 
@@ -106,18 +117,27 @@ def aes_dec_v3(ciphertext: bytes, key: bytes) -> bytes:
 def unwrap_v3_ckey(blob: bytes) -> bytes:
     if len(blob) < 32:
         raise ValueError(f"expected >=32-byte v3 blob, got {len(blob)}")
-    return bytes(a ^ b for a, b in zip(blob[:32], V3_UNWRAP_MASK_32))
+    value = int.from_bytes(blob[:32], "big") ^ _V3_UNWRAP_MASK_INT
+    return value.to_bytes(32, "big")
+
 
+def decrypt_ticket_key(license_b64: str | bytes) -> tuple[TicketData, bytes, bytes]:
+    return _decrypt_ticket_key_raw(binascii.a2b_base64(license_b64))
 
-def decrypt_ticket_key(license_b64: str) -> tuple[TicketData, bytes, bytes]:
-    ticket = parse_ticket(license_b64)
+
+def _decrypt_ticket_key_raw(raw: bytes) -> tuple[TicketData, bytes, bytes]:
+    ticket = _parse_ticket_raw(raw)
     blob = aes_dec_v3(ticket.ckey_cipher_data, ticket.kek_data)
     ckey32 = unwrap_v3_ckey(blob)
     return ticket, blob, ckey32
 
 
-def extract_dcid(license_b64: str) -> str:
-    raw = base64.b64decode(license_b64)
-    text = raw.decode("ascii", errors="ignore")
-    match = re.search(r"DCID-[A-Z0-9-]+", text)
-    return match.group(0) if match else ""
+def extract_dcid(license_b64: str | bytes) -> str:
+    return _extract_dcid_raw(binascii.a2b_base64(license_b64))
+
+
+def _extract_dcid_raw(raw: bytes) -> str:
+    # KID depends on matching across non-ASCII bytes; strip them before searching
+    text = raw.translate(None, _NON_ASCII)
+    match = _DCID_RE.search(text)
+    return match.group(0).decode("ascii") if match else ""